@@ -2,6 +2,19 @@ from __future__ import annotations
 
 import argparse
 
+from constants import DEFAULT_GITHUB_BATCH_SIZE, DEFAULT_GITHUB_CONCURRENCY
+
+
+def _positive_int(value: str) -> int:
+    """argparse ``type=`` for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Dataset generator (GitHub advisory fetcher)")
@@ -17,9 +30,42 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help='Advisory type filter (API param "type", e.g. reviewed/unreviewed/malware)',
     )
-    fetch.add_argument("--per-page", type=int, default=100, help="Items per page (max 100)")
+    fetch.add_argument(
+        "--per-page",
+        type=int,
+        default=100,
+        help="Items per page (max 100, GitHub's limit; use --concurrency for more throughput)",
+    )
     fetch.add_argument("--max-pages", type=int, default=1, help="Safety limit; set higher for more data")
+    fetch.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_GITHUB_CONCURRENCY,
+        help="Pages fetched in parallel after the first one; 1 fetches sequentially",
+    )
+    fetch.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=DEFAULT_GITHUB_BATCH_SIZE,
+        help="Pages requested per parallel batch while the total page count is unknown",
+    )
+    fetch.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the on-disk ETag cache of API responses",
+    )
     fetch.add_argument("--out", default=None, help="Write results as JSON to this file; otherwise prints to stdout")
+    fetch.add_argument(
+        "--format",
+        choices=("json", "jsonl"),
+        default="json",
+        help="Output a JSON array, or JSON Lines written incrementally as pages arrive",
+    )
+    fetch.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON array output for reading (JSON Lines is always compact)",
+    )
 
     return p
 
@@ -1,4 +1,8 @@
 DEFAULT_GITHUB_API = "https://api.github.com"
 DEFAULT_GITHUB_API_VERSION = "2022-11-28"
 DEFAULT_GITHUB_USER_AGENT = "dataset-generator/0.1" 
-DEFAULT_GITHUB_TIMEOUT_S = 30
\ No newline at end of file
+DEFAULT_GITHUB_TIMEOUT_S = 30
+DEFAULT_GITHUB_CONCURRENCY = 8
+DEFAULT_GITHUB_BATCH_SIZE = 8
+DEFAULT_GITHUB_CACHE_DIR = "~/.cache/dataset-generator/http"
+DEFAULT_GITHUB_RATE_LIMIT_MIN_REMAINING = 10
@@ -1,15 +1,217 @@
 from __future__ import annotations
 
+import codecs
+import gzip
+import http.client
+import itertools
 import json
+import re
+import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
-from dataclasses import dataclass
-from typing import Any, Iterator, Optional
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterable, Iterator, Optional
 
+from http_cache import ETagCache
 
-@dataclass(frozen=True)
+
+# Idle connections kept per (scheme, host); matches the default concurrency
+# so a parallel crawl can hand every worker a warm connection.
+_MAX_IDLE_CONNECTIONS_PER_HOST = 8
+
+
+class _ConnectionPool:
+    """
+    Persistent connections shared by all threads, keyed by (scheme, host).
+
+    A connection is checked out for one request/response and returned once
+    its body has been read, so keep-alive connections (and their completed
+    TCP+TLS handshakes) are reused across pages, worker threads and crawls.
+    """
+
+    def __init__(self, max_idle_per_host: int):
+        self._max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple[str, str], timeout: int) -> http.client.HTTPConnection:
+        """Check out an idle connection to ``key``, or open a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+
+        return _open_connection(*key, timeout=timeout)
+
+    def release(self, key: tuple[str, str], connection: http.client.HTTPConnection) -> None:
+        """Return a connection whose response has been fully read."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+
+_POOL = _ConnectionPool(_MAX_IDLE_CONNECTIONS_PER_HOST)
+
+
+class _ForwardProxyConnection(http.client.HTTPConnection):
+    """Plain-HTTP connection through a forwarding proxy, which expects absolute URLs."""
+
+    def __init__(
+        self,
+        proxy_host: str,
+        proxy_port: Optional[int],
+        origin: str,
+        proxy_headers: dict[str, str],
+        timeout: int,
+    ):
+        super().__init__(proxy_host, proxy_port, timeout=timeout)
+        self._origin = origin
+        self._extra_proxy_headers = proxy_headers
+
+    def putrequest(self, method: str, url: str, *args: Any, **kwargs: Any) -> None:
+        super().putrequest(method, f"{self._origin}{url}", *args, **kwargs)
+        for name, value in self._extra_proxy_headers.items():
+            self.putheader(name, value)
+
+
+def _open_connection(scheme: str, netloc: str, timeout: int) -> http.client.HTTPConnection:
+    """
+    Open a connection to ``scheme://netloc``, honouring the proxy environment.
+
+    Proxies come from ``http_proxy``/``https_proxy``/``no_proxy`` the same way
+    urllib resolves them: https is tunnelled with CONNECT, http is forwarded.
+    """
+    host = urllib.parse.urlsplit(f"//{netloc}").hostname or netloc
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=timeout)
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+
+    proxy_url = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    proxy_headers: dict[str, str] = {}
+    if proxy_url.username:
+        username = urllib.parse.unquote(proxy_url.username)
+        password = urllib.parse.unquote(proxy_url.password or "")
+        credentials = f"{username}:{password}"
+        proxy_headers["Proxy-Authorization"] = f"Basic {b64encode(credentials.encode()).decode()}"
+
+    if scheme == "https":
+        connection = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port, timeout=timeout)
+        connection.set_tunnel(netloc, headers=proxy_headers)
+        return connection
+
+    return _ForwardProxyConnection(
+        proxy_url.hostname, proxy_url.port, f"{scheme}://{netloc}", proxy_headers, timeout
+    )
+
+
+# GitHub caps per_page at 100, so a larger request still returns full pages of 100.
+_MAX_PER_PAGE = 100
+
+# How many times a rate-limited (403/429) request is retried before giving up.
+_MAX_RATE_LIMIT_RETRIES = 3
+
+
+# Bytes read from the response per step while streaming a JSON array.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_ITEM_DELIMITERS = frozenset(" \t\n\r,]")
+
+
+def _iter_json_array(stream: IO[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Incrementally decode a top-level JSON array read from ``stream``.
+
+    Each item is yielded as soon as its closing token has been read, so the
+    full response body is never held in memory at once.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    buffer = ""
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, eof
+        chunk = stream.read(_STREAM_CHUNK_SIZE)
+        eof = not chunk
+        buffer += decoder.decode(chunk, final=eof)
+
+    def skip_whitespace(pos: int) -> int:
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return pos
+            read_more()
+
+    pos = skip_whitespace(0)
+    if buffer[pos:pos + 1] != "[":
+        # Not an array (e.g. an error object); decode it whole to report its type.
+        while not eof:
+            read_more()
+        value = json.loads(buffer) if buffer.strip() else None
+        raise RuntimeError(f"Expected list response from API, got {type(value).__name__}")
+
+    pos = skip_whitespace(pos + 1)
+    closed = buffer[pos:pos + 1] == "]"
+    while not closed:
+        while True:
+            try:
+                item, end = _JSON_DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more()
+                continue
+            # A number cut at the chunk edge (e.g. "2." of "2.5") decodes early,
+            # so only accept an item once the delimiter after it has been read.
+            if eof or buffer[end:end + 1] in _JSON_ITEM_DELIMITERS:
+                break
+            read_more()
+        yield item
+
+        buffer = buffer[end:]
+        pos = skip_whitespace(0)
+        token = buffer[pos:pos + 1]
+        if token == "]":
+            closed = True
+        elif token == ",":
+            pos = skip_whitespace(pos + 1)
+        elif not token:
+            raise json.JSONDecodeError("Unterminated array", buffer, pos)
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+
+    # Drain the rest of the body so the connection can be reused.
+    while not eof:
+        buffer = ""
+        read_more()
+
+
+def _parse_link_header(value: Optional[str]) -> dict[str, str]:
+    """Parse an RFC 8288 ``Link`` header into a ``{rel: url}`` mapping."""
+    links: dict[str, str] = {}
+    for part in (value or "").split(","):
+        url, _, params = part.partition(";")
+        url = url.strip()
+        if not (url.startswith("<") and url.endswith(">")):
+            continue
+        for param in params.split(";"):
+            key, _, rel = param.strip().partition("=")
+            if key == "rel":
+                for name in rel.strip('"').split():
+                    links[name] = url[1:-1]
+    return links
+
+
+@dataclass(frozen=True, slots=True)
 class GitHubAdvisoryClient:
     """Client for fetching advisories from GitHub's global security advisories API."""
 
@@ -18,6 +220,23 @@ class GitHubAdvisoryClient:
     api_version: str
     user_agent: str
     request_timeout_s: int
+    cache: Optional[ETagCache] = None
+    rate_limit_min_remaining: int = 10
+
+    # Derived from the fields above in __post_init__.
+    _headers: dict[str, str] = field(init=False, repr=False, compare=False)
+    _base_path: str = field(init=False, repr=False, compare=False)
+    _origin: str = field(init=False, repr=False, compare=False)
+    _pool_key: tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The client is frozen, so its headers and base URL never change;
+        # build them once instead of on every request.
+        base = urllib.parse.urlsplit(self.api_base_url)
+        object.__setattr__(self, "_headers", self._build_headers())
+        object.__setattr__(self, "_base_path", base.path.rstrip("/"))
+        object.__setattr__(self, "_origin", f"{base.scheme}://{base.netloc}")
+        object.__setattr__(self, "_pool_key", (base.scheme, base.netloc))
 
     def _build_headers(self) -> dict[str, str]:
         """Build HTTP headers for GitHub API requests."""
@@ -25,18 +244,20 @@ class GitHubAdvisoryClient:
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": self.api_version,
             "User-Agent": self.user_agent,
+            # Advisory JSON compresses well; the body is gunzipped as it streams.
+            "Accept-Encoding": "gzip",
         }
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
 
-    def _fetch_json(
+    def _build_url(
         self, 
         path: str, 
         query_params: Optional[dict[str, Any]] = None
-    ) -> Any:
-        """Make a GET request to the GitHub API and return JSON response."""
-        url = f"{self.api_base_url.rstrip('/')}/{path.lstrip('/')}"
+    ) -> str:
+        """Build a request URL (relative to the API host) for ``path``."""
+        url = f"{self._base_path}/{path.lstrip('/')}"
         
         if query_params:
             # Filter out None values
@@ -44,32 +265,187 @@ class GitHubAdvisoryClient:
             if filtered_params:
                 url = f"{url}?{urllib.parse.urlencode(filtered_params, doseq=True)}"
 
-        request = urllib.request.Request(
-            url=url, 
-            method="GET", 
-            headers=self._build_headers()
-        )
+        return url
 
-        try:
-            with urllib.request.urlopen(request, timeout=self.request_timeout_s) as response:
-                content = response.read()
-                encoding = response.headers.get_content_charset() or "utf-8"
-                text = content.decode(encoding, errors="replace")
-                return json.loads(text) if text else None
-                
-        except urllib.error.HTTPError as error:
-            error_message = self._extract_error_message(error)
+    def _fetch_json_items(self, url: str) -> tuple[Iterator[Any], http.client.HTTPMessage]:
+        """
+        Make a GET request to the GitHub API expecting a JSON array.
+
+        ``url`` is relative to the API host, as returned by ``_build_url``.
+        Returns a generator over the array items, which are parsed as the body
+        is read, and the response headers.
+        """
+        cache_key = f"{self._origin}{url}"
+        cached = self.cache.lookup(cache_key) if self.cache else None
+        request_headers = {"If-None-Match": cached.etag} if cached else {}
+
+        pool_key = self._pool_key
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            connection, response = self._send(pool_key, url, request_headers)
+            delay = self._rate_limit_delay(response, attempt)
+            if delay is None or attempt == _MAX_RATE_LIMIT_RETRIES:
+                break
+            self._read_and_release(pool_key, connection, response)
+            time.sleep(delay)
+
+        if response.status == 304 and cached is not None:
+            # Unchanged since the cached copy; replay it from disk.
+            self._read_and_release(pool_key, connection, response)
+            return self._iter_cached_items(cached.body_path, cached.encoding), response.headers
+
+        if not 200 <= response.status < 300:
+            # Includes redirects, which are not followed.
+            content = self._read_and_release(pool_key, connection, response)
+            error_message = self._extract_error_message(response, content)
             raise RuntimeError(
-                f"GitHub API request failed (HTTP {error.code}): {error_message}"
-            ) from error
+                f"GitHub API request failed (HTTP {response.status}): {error_message}"
+            )
+
+        try:
+            stream = self._decoded_body(response)
+            encoding = response.headers.get_content_charset() or "utf-8"
+            etag = response.headers.get("ETag")
+            if self.cache and etag:
+                try:
+                    stream = self.cache.record(cache_key, etag, encoding, stream)
+                except OSError:
+                    # The cache is best-effort (e.g. a read-only home directory).
+                    pass
+        except BaseException:
+            connection.close()
+            raise
+
+        return self._iter_response_items(pool_key, connection, stream, encoding), response.headers
+
+    @classmethod
+    def _read_and_release(
+        cls,
+        pool_key: tuple[str, str],
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> bytes:
+        """Read the rest of the body, then return the connection to the pool."""
+        try:
+            content = cls._decoded_body(response).read()
+        except BaseException:
+            connection.close()
+            raise
+        _POOL.release(pool_key, connection)
+        return content
 
     @staticmethod
-    def _extract_error_message(error: urllib.error.HTTPError) -> str:
-        """Extract error message from HTTP error response."""
+    def _decoded_body(response: http.client.HTTPResponse) -> IO[bytes]:
+        """Return the response body as a stream, decompressing gzip on the fly."""
+        if response.headers.get("Content-Encoding", "").strip().lower() == "gzip":
+            return gzip.GzipFile(fileobj=response, mode="rb")
+        return response
+
+    @staticmethod
+    def _iter_response_items(
+        pool_key: tuple[str, str],
+        connection: http.client.HTTPConnection,
+        stream: IO[bytes],
+        encoding: str,
+    ) -> Iterator[Any]:
+        """Stream JSON array items from ``stream``, then hand the connection back to the pool."""
         try:
-            return error.read().decode("utf-8", errors="replace")
-        except Exception:
-            return getattr(error, "reason", "Unknown error")
+            yield from _iter_json_array(stream, encoding)
+        except BaseException:
+            # Not fully read, so the connection can't carry another request.
+            connection.close()
+            raise
+        finally:
+            stream.close()
+        _POOL.release(pool_key, connection)
+
+    @staticmethod
+    def _iter_cached_items(body_path: str, encoding: str) -> Iterator[Any]:
+        """Stream JSON array items from a cached response body."""
+        with open(body_path, "rb") as stream:
+            yield from _iter_json_array(stream, encoding)
+
+    def _wait_for_rate_limit(self, headers: http.client.HTTPMessage) -> bool:
+        """
+        Sleep until the rate-limit window resets if the remaining budget is low.
+
+        Returns False when the response carried no rate-limit headers.
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if not (remaining and remaining.isdigit()):
+            return False
+
+        reset = headers.get("X-RateLimit-Reset")
+        if int(remaining) < self.rate_limit_min_remaining and reset and reset.isdigit():
+            time.sleep(max(0.0, int(reset) - time.time()))
+        return True
+
+    def _pace(self, headers: http.client.HTTPMessage, sleep_s: float) -> None:
+        """
+        Wait before another request, based on the headers of the previous one.
+
+        Only called once a further request is certain, so a crawl never sleeps
+        after its final page.
+        """
+        has_rate_limit_headers = self._wait_for_rate_limit(headers)
+        if not has_rate_limit_headers and sleep_s > 0:
+            time.sleep(sleep_s)
+
+    @staticmethod
+    def _rate_limit_delay(response: http.client.HTTPResponse, attempt: int) -> Optional[float]:
+        """
+        Return how long to wait before retrying a rate-limited response.
+
+        Returns None when the response is not a rate-limit error (a plain 403,
+        e.g. a missing permission, is not retried).
+        """
+        if response.status not in (403, 429):
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+
+        reset = response.headers.get("X-RateLimit-Reset")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+            return max(0.0, int(reset) - time.time()) + 1.0
+
+        if response.status == 429:
+            # No hint from the server; back off exponentially.
+            return float(2 ** attempt)
+        return None
+
+    def _send(
+        self, 
+        pool_key: tuple[str, str], 
+        url: str,
+        extra_headers: dict[str, str],
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send a GET over a pooled persistent connection.
+
+        The caller reads the body and then releases the connection to the pool.
+        """
+        connection = _POOL.acquire(pool_key, self.request_timeout_s)
+        headers = {**self._headers, **extra_headers} if extra_headers else self._headers
+        try:
+            try:
+                connection.request("GET", url, headers=headers)
+                response = connection.getresponse()
+            except (ConnectionResetError, BrokenPipeError):
+                # The server may have dropped an idle kept-alive connection;
+                # retry once on a fresh one.
+                connection.close()
+                connection.request("GET", url, headers=headers)
+                response = connection.getresponse()
+            return connection, response
+        except BaseException:
+            connection.close()
+            raise
+
+    @staticmethod
+    def _extract_error_message(response: http.client.HTTPResponse, content: bytes) -> str:
+        """Extract error message from HTTP error response."""
+        return content.decode("utf-8", errors="replace") or response.reason or "Unknown error"
 
     def fetch_advisories(
         self,
@@ -92,23 +468,44 @@ class GitHubAdvisoryClient:
         Returns:
             List of advisory dictionaries
         """
-        response = self._fetch_json(
+        advisories, _ = self._fetch_advisories_page(
+            self._advisories_url(ecosystem, severity, advisory_type, per_page), page
+        )
+        return advisories
+
+    def _advisories_url(
+        self,
+        ecosystem: Optional[str],
+        severity: Optional[str],
+        advisory_type: Optional[str],
+        per_page: Optional[int],
+    ) -> str:
+        """
+        Build the ``/advisories`` URL for a set of filters, ending in ``?`` or ``&``.
+
+        Only the page number changes while paginating, so this is built once
+        per crawl and ``page=N`` is appended for each request.
+        """
+        url = self._build_url(
             "/advisories",
             query_params={
                 "ecosystem": ecosystem,
                 "severity": severity,
                 "type": advisory_type,
                 "per_page": per_page,
-                "page": page,
             },
         )
-        
-        if not isinstance(response, list):
-            raise RuntimeError(
-                f"Expected list response from API, got {type(response).__name__}"
-            )
-        
-        return [item for item in response if isinstance(item, dict)]
+        return f"{url}&" if "?" in url else f"{url}?"
+
+    def _fetch_advisories_page(
+        self,
+        advisories_url: str,
+        page: int,
+    ) -> tuple[list[dict[str, Any]], http.client.HTTPMessage]:
+        """Fetch a single page of advisories along with the response headers."""
+        items, headers = self._fetch_json_items(f"{advisories_url}page={page}")
+
+        return [item for item in items if isinstance(item, dict)], headers
 
     def iter_advisories(
         self,
@@ -118,6 +515,8 @@ class GitHubAdvisoryClient:
         per_page: int = 100,
         max_pages: Optional[int] = None,
         sleep_s: float = 0.0,
+        concurrency: int = 1,
+        batch_size: Optional[int] = None,
     ) -> Iterator[dict[str, Any]]:
         """
         Iterate through all advisories across multiple pages.
@@ -128,27 +527,137 @@ class GitHubAdvisoryClient:
             advisory_type: Filter by advisory type
             per_page: Number of results per page
             max_pages: Maximum number of pages to fetch (None for all)
-            delay_seconds: Delay between requests to respect rate limits
+            sleep_s: Fixed delay before each page after the first (per worker
+                when fetching concurrently), used only when the API sends no
+                rate-limit headers; otherwise pagination runs at full speed and pauses
+                until the window resets once fewer than
+                ``rate_limit_min_remaining`` requests are left
+            concurrency: Number of pages to fetch in parallel after the first
+                one; 1 fetches sequentially
+            batch_size: Pages requested per concurrent batch when the first
+                page has no ``rel="last"`` link giving the page count
+                (defaults to ``concurrency``); batches continue until one
+                reaches the last page
             
         Yields:
-            Individual advisory dictionaries
+            Individual advisory dictionaries, in page order
         """
+        advisories_url = self._advisories_url(ecosystem, severity, advisory_type, per_page)
+        # Bound once; these are called on every page.
+        fetch_page = self._fetch_advisories_page
+        is_last_page = self._is_last_page
+        pace = self._pace
         page = 1
+        headers: Optional[http.client.HTTPMessage] = None
         
         while max_pages is None or page <= max_pages:
-            advisories = self.fetch_advisories(
-                ecosystem=ecosystem,
-                severity=severity,
-                advisory_type=advisory_type,
-                per_page=per_page,
-                page=page,
-            )
+            if headers is not None:
+                pace(headers, sleep_s)
+            advisories, headers = fetch_page(advisories_url, page)
             
             if not advisories:
                 break
 
             yield from advisories
+            if is_last_page(advisories, headers, per_page):
+                break
+
+            if concurrency > 1 and page == 1:
+                last_page = self._last_page(headers)
+
+                pages: Iterable[int]
+                if last_page is None:
+                    # Page count unknown: probe ahead one batch at a time, up to
+                    # the max_pages safety limit (which is not a page count).
+                    pages, batch = itertools.count(2), batch_size or concurrency
+                    if max_pages is not None:
+                        pages = itertools.islice(pages, max(0, max_pages - 1))
+                else:
+                    if max_pages is not None:
+                        last_page = min(last_page, max_pages)
+                    pages = range(2, last_page + 1)
+                    batch = max(1, len(pages))
+                yield from self._iter_pages_concurrently(
+                    advisories_url=advisories_url,
+                    per_page=per_page,
+                    pages=pages,
+                    concurrency=concurrency,
+                    batch_size=batch,
+                    headers=headers,
+                    sleep_s=sleep_s,
+                )
+                return
 
             page += 1
-            if sleep_s > 0:
-                time.sleep(sleep_s)
\ No newline at end of file
+
+    @staticmethod
+    def _is_last_page(
+        advisories: list[dict[str, Any]],
+        headers: http.client.HTTPMessage,
+        per_page: int,
+    ) -> bool:
+        """
+        Whether no page after this one can have results.
+
+        A short page is the last one, as is a page whose ``Link`` header has no
+        ``rel="next"``. Either way iteration can stop without requesting a
+        page just to find it empty.
+        """
+        if len(advisories) < min(per_page, _MAX_PER_PAGE):
+            return True
+        link = headers.get("Link")
+        return link is not None and "next" not in _parse_link_header(link)
+
+    @staticmethod
+    def _last_page(headers: http.client.HTTPMessage) -> Optional[int]:
+        """Return the page number of the ``rel="last"`` link, if GitHub sent one."""
+        last_url = _parse_link_header(headers.get("Link")).get("last")
+        if last_url is None:
+            return None
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(last_url).query)
+        pages = query.get("page")
+        return int(pages[0]) if pages and pages[0].isdigit() else None
+
+    def _iter_pages_concurrently(
+        self,
+        advisories_url: str,
+        per_page: int,
+        pages: Iterable[int],
+        concurrency: int,
+        batch_size: int,
+        headers: http.client.HTTPMessage,
+        sleep_s: float,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Fetch ``pages`` in batches with up to ``concurrency`` requests in flight.
+
+        Advisories are yielded in page order. Stops at the last page (see
+        ``_is_last_page``), so ``pages`` may be unbounded. Each worker paces
+        itself before its request by the most recent response ``headers``
+        (see ``_pace``), so fetched pages are handed back without delay.
+        """
+        fetch_advisories_page = self._fetch_advisories_page
+        is_last_page = self._is_last_page
+        pace = self._pace
+        # Headers of the latest response from any worker.
+        latest_headers = [headers]
+
+        def fetch_page(page: int) -> tuple[list[dict[str, Any]], bool]:
+            pace(latest_headers[0], sleep_s)
+            advisories, page_headers = fetch_advisories_page(advisories_url, page)
+            latest_headers[0] = page_headers
+            return advisories, is_last_page(advisories, page_headers, per_page)
+
+        pages = iter(pages)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            while True:
+                batch = list(itertools.islice(pages, batch_size))
+                if not batch:
+                    return
+                for advisories, is_last in executor.map(fetch_page, batch):
+                    yield from advisories
+                    if is_last:
+                        return
+        finally:
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import IO, Optional
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached response body and the ETag it was served with."""
+
+    etag: str
+    encoding: str
+    body_path: str
+
+
+@dataclass(frozen=True)
+class ETagCache:
+    """
+    On-disk cache of GET response bodies, keyed by URL.
+
+    Entries are revalidated with ``If-None-Match``; on a 304 the body is read
+    back from disk instead of being downloaded again.
+    """
+
+    directory: str
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached entry for ``url``, if there is a complete one."""
+        body_path = self._path(url, ".body")
+        try:
+            with open(self._path(url, ".meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(meta, dict) or not meta.get("etag") or not os.path.exists(body_path):
+            return None
+        return CachedResponse(
+            etag=meta["etag"],
+            encoding=meta.get("encoding") or "utf-8",
+            body_path=body_path,
+        )
+
+    def record(self, url: str, etag: str, encoding: str, stream: IO[bytes]) -> _RecordingReader:
+        """Wrap ``stream`` so its body is stored for ``url`` once it has been fully read."""
+        return _RecordingReader(self, url, etag, encoding, stream)
+
+    def _store(self, url: str, etag: str, encoding: str, body_tmp_path: str) -> None:
+        os.replace(body_tmp_path, self._path(url, ".body"))
+        meta_fd, meta_tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(meta_fd, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "etag": etag, "encoding": encoding}, f)
+        os.replace(meta_tmp_path, self._path(url, ".meta.json"))
+
+
+class _RecordingReader:
+    """File-like wrapper that copies everything read from a stream into the cache."""
+
+    def __init__(self, cache: ETagCache, url: str, etag: str, encoding: str, stream: IO[bytes]):
+        os.makedirs(cache.directory, exist_ok=True)
+        self._cache = cache
+        self._url = url
+        self._etag = etag
+        self._encoding = encoding
+        self._stream = stream
+        self._file = tempfile.NamedTemporaryFile(dir=cache.directory, suffix=".tmp", delete=False)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        if self._file.closed:
+            return data
+        try:
+            if data:
+                self._file.write(data)
+            else:
+                # End of body: publish the complete copy.
+                self._file.close()
+                self._cache._store(self._url, self._etag, self._encoding, self._file.name)
+        except OSError:
+            # Caching is best-effort; keep serving the body without it.
+            self._discard()
+        return data
+
+    def close(self) -> None:
+        self._stream.close()
+        if not self._file.closed:
+            # Body was not read to the end; don't cache a truncated copy.
+            self._discard()
+
+    def _discard(self) -> None:
+        self._file.close()
+        try:
+            os.unlink(self._file.name)
+        except OSError:
+            pass
@@ -1,47 +1,140 @@
 from __future__ import annotations
 
-import argparse
 import json
 import os
+import queue
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Optional
 
 from cli_parser import build_parser
-from constants import DEFAULT_GITHUB_API, DEFAULT_GITHUB_API_VERSION, DEFAULT_GITHUB_USER_AGENT, DEFAULT_GITHUB_TIMEOUT_S
+from constants import (
+    DEFAULT_GITHUB_API,
+    DEFAULT_GITHUB_API_VERSION,
+    DEFAULT_GITHUB_CACHE_DIR,
+    DEFAULT_GITHUB_RATE_LIMIT_MIN_REMAINING,
+    DEFAULT_GITHUB_TIMEOUT_S,
+    DEFAULT_GITHUB_USER_AGENT,
+)
 from github_advisory_client import GitHubAdvisoryClient
+from http_cache import ETagCache
+
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the standard library produces equivalent JSON
+    orjson = None
+
+
+def dumps_json(value: Any, pretty: bool = False) -> bytes:
+    """Serialize ``value`` to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 def fetch_advisories(args: argparse.Namespace) -> int:
 
+    cache_dir = os.path.expanduser(os.getenv("GITHUB_CACHE_DIR") or DEFAULT_GITHUB_CACHE_DIR)
+
     client = GitHubAdvisoryClient(
         token=os.getenv("GITHUB_TOKEN") or os.getenv("github_token"),
         api_base_url=os.getenv("GITHUB_API_BASE_URL") or DEFAULT_GITHUB_API,    
         api_version=os.getenv("GITHUB_API_VERSION") or DEFAULT_GITHUB_API_VERSION,
         user_agent=os.getenv("GITHUB_USER_AGENT") or DEFAULT_GITHUB_USER_AGENT,
         request_timeout_s=int(os.getenv("GITHUB_TIMEOUT_S") or DEFAULT_GITHUB_TIMEOUT_S),
+        cache=None if args.no_cache else ETagCache(cache_dir),
+        rate_limit_min_remaining=int(
+            os.getenv("GITHUB_RATE_LIMIT_MIN_REMAINING") or DEFAULT_GITHUB_RATE_LIMIT_MIN_REMAINING
+        ),
     )
 
-    items: List[Dict[str, Any]] = list(
-        client.iter_advisories(
-            ecosystem=args.ecosystem,
-            severity=args.severity,
-            advisory_type=args.advisory_type,
-            per_page=args.per_page,
-            max_pages=args.max_pages,
-            sleep_s=float(os.getenv("GITHUB_API_SLEEP_S") or "0.0"),
-        )
+    advisories = client.iter_advisories(
+        ecosystem=args.ecosystem,
+        severity=args.severity,
+        advisory_type=args.advisory_type,
+        per_page=args.per_page,
+        max_pages=args.max_pages,
+        sleep_s=float(os.getenv("GITHUB_API_SLEEP_S") or "0.0"),
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
     )
 
+    if args.format == "jsonl":
+        return write_jsonl(advisories, args.out)
+
+    items: List[Dict[str, Any]] = list(advisories)
+
     if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+        with open(args.out, "wb") as f:
+            f.write(dumps_json(items, pretty=args.pretty))
         print(f"Wrote {len(items)} advisories to {args.out}")
     else:
-        print(json.dumps(items, ensure_ascii=False, indent=2))
+        print(dumps_json(items, pretty=args.pretty).decode("utf-8"))
+
+    return 0
+
 
+def write_jsonl(advisories: Iterable[Dict[str, Any]], out: Optional[str]) -> int:
+    """Write one advisory per line as it arrives, without collecting the full result."""
+    if not out:
+        write_lines_in_background(advisories, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+        return 0
+
+    with open(out, "wb") as f:
+        count = write_lines_in_background(advisories, f)
+    print(f"Wrote {count} advisories to {out}")
     return 0
 
 
+# Advisories buffered between the fetching loop and the writer thread.
+_WRITE_QUEUE_SIZE = 1024
+
+
+def write_lines_in_background(advisories: Iterable[Dict[str, Any]], f: BinaryIO) -> int:
+    """
+    Serialize and write advisories as JSON Lines on a separate thread.
+
+    The calling thread keeps pulling advisories (i.e. fetching pages) while the
+    writer encodes and writes the previous ones. Returns the number written.
+    """
+    pending: queue.Queue[Optional[Dict[str, Any]]] = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+    errors: List[BaseException] = []
+
+    def writer() -> None:
+        try:
+            while (item := pending.get()) is not None:
+                f.write(dumps_json(item) + b"\n")
+        except BaseException as error:
+            errors.append(error)
+            # Keep consuming so the fetching thread never blocks on a full queue.
+            while pending.get() is not None:
+                pass
+
+    thread = threading.Thread(target=writer, name="jsonl-writer", daemon=True)
+    thread.start()
+
+    count = 0
+    try:
+        for item in advisories:
+            if errors:
+                break
+            pending.put(item)
+            count += 1
+    finally:
+        pending.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return count
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)